@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from erie_connect.client import ErieConnect
@@ -13,6 +15,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -29,9 +33,15 @@ from .const import (
     DATA_API,
     DATA_COORDINATOR,
     DEFAULT_FLOW_SCAN_INTERVAL,
+    DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SERVICE_INTERVAL_DAYS,
     DOMAIN,
+    EMPTY_MAPPING,
+    MANUFACTURER,
+    REQUEST_REFRESH_COOLDOWN,
     SCAN_INTERVAL,
+    SETTINGS_SCAN_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,11 +54,65 @@ type PentairWaterConfigEntry = ConfigEntry[PentairWaterData]
 class PentairWaterData:
     """Data class to hold API and coordinator."""
 
-    def __init__(self, api: ErieConnect, coordinator: DataUpdateCoordinator, flow_coordinator: DataUpdateCoordinator) -> None:
+    def __init__(
+        self,
+        api: ErieConnect,
+        coordinator: DataUpdateCoordinator,
+        settings_coordinator: DataUpdateCoordinator,
+        flow_coordinator: DataUpdateCoordinator,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the data class."""
         self.api = api
         self.coordinator = coordinator
+        self.settings_coordinator = settings_coordinator
         self.flow_coordinator = flow_coordinator
+        self.device_info = device_info
+
+
+def _has_salt_warning(descriptions: tuple[str, ...]) -> bool:
+    """Return true if any warning description mentions salt."""
+    return any("salt" in description.lower() for description in descriptions)
+
+
+def _parse_warnings(
+    dashboard: dict[str, Any],
+) -> tuple[list[dict[str, Any]], tuple[str, ...]]:
+    """Return the dashboard warnings and their descriptions.
+
+    The API may send null instead of a list; entries that are not dicts and
+    descriptions that are not strings are skipped.
+    """
+    warnings = [
+        warning for warning in dashboard.get("warnings") or [] if isinstance(warning, dict)
+    ]
+    descriptions = tuple(
+        description
+        for warning in warnings
+        if isinstance(description := warning.get("description"), str)
+    )
+    return warnings, descriptions
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse an ISO 8601 timestamp from the API, accepting a trailing "Z"."""
+    # Checked before the cache, which would fail to hash a dict or list
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_timestamp_str(value)
+
+
+@lru_cache(maxsize=4)
+def _parse_timestamp_str(value: str) -> datetime | None:
+    """Parse a timestamp string for _parse_timestamp.
+
+    Timestamps rarely change between refreshes, so recent results are cached.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        _LOGGER.warning("Failed to parse timestamp value: %s", value)
+        return None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry) -> bool:
@@ -71,6 +135,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
         ),
     )
 
+    # API calls run on several executor threads at once, but share one client
+    auth_lock = threading.Lock()
+
     def _safe_api_call(api_method):
         """Call an API method, retrying once with fresh login on auth failure.
 
@@ -80,7 +147,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
         select_first_active_device() when it tries response.content[0] on None.
 
         This wrapper catches that and forces a fresh login before retrying.
+        Re-login is serialized, and skipped when another thread has already
+        replaced the auth this call was made with.
         """
+        auth = api.auth
         try:
             result = api_method()
             if result is None:
@@ -89,39 +159,74 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
         except (AttributeError, RequestException):
             _LOGGER.debug("API call %s failed, forcing re-login", getattr(api_method, '__name__', str(api_method)))
             try:
-                api._auth = None
-                api._device = None
-                api.login()
-                api.select_first_active_device()
+                with auth_lock:
+                    # login() and select_first_active_device() replace the auth
+                    # and device in one assignment each, so calls running on
+                    # other threads never see them unset. The client itself
+                    # drops its auth on a 401.
+                    if api.auth is auth or api.auth is None:
+                        api.login()
+                        api.select_first_active_device()
                 return api_method()
             except Exception as retry_err:
                 _LOGGER.warning("Re-login and retry failed for %s: %s", getattr(api_method, '__name__', str(api_method)), retry_err)
                 return None
 
+    def _async_api_call(api_method) -> asyncio.Future:
+        """Run an API method through _safe_api_call in the executor.
+
+        Home Assistant's shared executor is used so a hung request (the client
+        sets no timeout) cannot block shutdown.
+        """
+        return hass.async_add_executor_job(_safe_api_call, api_method)
+
+    # Unknown until the first features request shows whether the device has them
+    features_supported: bool | None = None
+
+    async def async_fetch_features() -> dict[str, Any]:
+        """Fetch device features, skipping the request on devices without them."""
+        nonlocal features_supported
+        if features_supported is False:
+            return {}
+
+        try:
+            response_features = await _async_api_call(api.features)
+        except Exception:
+            response_features = None
+
+        if response_features is None:
+            if features_supported is None:
+                _LOGGER.debug("Features endpoint not available, no longer requesting it")
+                features_supported = False
+            return {}
+
+        features_supported = True
+        return getattr(response_features, "content", None) or {}
+
+    # Warnings rarely change between refreshes, so the salt check result for
+    # this entry's last seen descriptions is kept
+    last_descriptions: tuple[str, ...] | None = None
+    last_low_salt = False
+
     async def async_update_data() -> dict[str, Any]:
         """Fetch data from API endpoint."""
+        nonlocal last_descriptions, last_low_salt
         try:
-            response = await hass.async_add_executor_job(_safe_api_call, api.info)
-            response_dashboard = await hass.async_add_executor_job(_safe_api_call, api.dashboard)
-            response_settings = await hass.async_add_executor_job(_safe_api_call, api.settings)
-            response_flow = await hass.async_add_executor_job(_safe_api_call, api.flow)
-
-            # Try to get features (may not be available on all devices)
-            try:
-                response_features = await hass.async_add_executor_job(_safe_api_call, api.features)
-                features = getattr(response_features, "content", None) or {}
-            except Exception:
-                features = {}
+            # The endpoints are independent, so fetch them concurrently
+            response, response_dashboard = await asyncio.gather(
+                _async_api_call(api.info),
+                _async_api_call(api.dashboard),
+            )
 
             # Guard against None responses (response or response.content can be None)
             info = getattr(response, "content", None) or {}
             dashboard_data = getattr(response_dashboard, "content", None) or {}
 
-            # Log raw API responses for debugging
-            _LOGGER.debug("RAW API info: %s", info)
-            _LOGGER.debug("RAW API dashboard: %s", dashboard_data)
-            _LOGGER.debug("RAW API settings: %s", getattr(response_settings, "content", None) or {})
-            _LOGGER.debug("RAW API flow: %s", getattr(response_flow, "content", None) or {})
+            # Log raw API responses for debugging, without formatting them
+            # on every refresh when debug logging is off
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("RAW API info: %s", info)
+                _LOGGER.debug("RAW API dashboard: %s", dashboard_data)
 
             # Parse total volume - remove unit suffix if present
             total_volume_raw = info.get("total_volume", "0")
@@ -130,13 +235,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
             else:
                 total_volume = str(total_volume_raw)
 
-            # Parse settings
-            settings = getattr(response_settings, "content", None) or {}
-            settings_inner = settings.get("settings", {})
-
-            # Parse flow data
-            flow_data = getattr(response_flow, "content", None) or {}
-
             # Parse dashboard data
             dashboard = dashboard_data
 
@@ -144,27 +242,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
             status_data = dashboard.get("status", {})
             _LOGGER.debug("Dashboard status data: %s", status_data)
 
+            # Check for a salt warning once per refresh instead of on every state read
+            warnings, descriptions = _parse_warnings(dashboard)
+            if descriptions != last_descriptions:
+                last_descriptions = descriptions
+                last_low_salt = _has_salt_warning(descriptions)
+            low_salt = last_low_salt
+
+            # Parse timestamps once per refresh so entities get datetimes
+            last_maintenance = _parse_timestamp(info.get("last_maintenance"))
+            next_service = (
+                last_maintenance + timedelta(days=DEFAULT_SERVICE_INTERVAL_DAYS)
+                if last_maintenance
+                else None
+            )
+
             return {
-                "last_regeneration": info.get("last_regeneration"),
+                "last_regeneration": _parse_timestamp(info.get("last_regeneration")),
                 "nr_regenerations": info.get("nr_regenerations"),
-                "last_maintenance": info.get("last_maintenance"),
+                "last_maintenance": last_maintenance,
+                "next_service_date": next_service,
+                "next_service_epoch": next_service.timestamp() if next_service else None,
                 "total_volume": total_volume,
-                "warnings": dashboard.get("warnings", []),
+                "warnings": warnings,
+                "low_salt": low_salt,
                 "serial": info.get("serial"),
                 "software": info.get("software", "").strip(),
                 "status": status_data,
-                "settings": settings,
                 "holiday_mode": dashboard.get("holiday_mode", False),
-                "features": features,
-                "flow": flow_data.get("flow", 0),
-                "water_hardness": settings_inner.get("install_hardness"),
-                "regen_time": dashboard.get("meta", {}).get("regen_time"),
+                "regen_time": (dashboard.get("meta") or EMPTY_MAPPING).get("regen_time"),
             }
         except Exception as err:
             _LOGGER.error("Error fetching Pentair data: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    # Get scan interval from options, or use default
+    async def async_update_settings_data() -> dict[str, Any]:
+        """Fetch rarely changing settings and features from API endpoint."""
+        try:
+            response_settings, features = await asyncio.gather(
+                _async_api_call(api.settings),
+                async_fetch_features(),
+            )
+
+            settings = getattr(response_settings, "content", None) or {}
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("RAW API settings: %s", settings)
+
+            return {
+                "settings": settings,
+                "features": features,
+                "water_hardness": (settings.get("settings") or EMPTY_MAPPING).get("install_hardness"),
+            }
+        except Exception as err:
+            _LOGGER.error("Error fetching Pentair settings: %s", err)
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    # Get scan interval from options, or use default. Options are only read
+    # here at setup: changing them reloads the entry, so the update methods
+    # above never need to look at entry.options
     scan_interval_seconds = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     update_interval = timedelta(seconds=scan_interval_seconds)
     
@@ -177,15 +312,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
         name=DOMAIN,
         update_method=async_update_data,
         update_interval=update_interval,
+        # Only notify entities when the fetched data actually changed
+        always_update=False,
+        # Coalesce back-to-back refresh requests from button presses/switch toggles
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=True
+        ),
     )
 
-    # Create a separate coordinator for flow data that updates every 5 seconds
+    # Settings and features rarely change, so poll them far less often
+    settings_coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"{DOMAIN}_settings",
+        update_method=async_update_settings_data,
+        update_interval=timedelta(seconds=SETTINGS_SCAN_INTERVAL),
+        always_update=False,
+    )
+
+    # Flow is only polled by this separate, faster coordinator so the main
+    # refresh does not request the same endpoint again
+    pending_flow: asyncio.Future | None = None
+
     async def async_update_flow_data() -> dict[str, Any]:
         """Fetch flow data from API endpoint."""
+        nonlocal pending_flow
         try:
-            response_flow = await hass.async_add_executor_job(_safe_api_call, api.flow)
+            # Refreshes that overlap an in-flight request share its result
+            # instead of issuing another one
+            if pending_flow is None or pending_flow.done():
+                pending_flow = _async_api_call(api.flow)
+            response_flow = await asyncio.shield(pending_flow)
             flow_data = getattr(response_flow, "content", None) or {}
-            _LOGGER.debug("RAW API flow (fast poll): %s", flow_data)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("RAW API flow (fast poll): %s", flow_data)
             return {
                 "flow": flow_data.get("flow", 0),
             }
@@ -199,14 +359,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairWaterConfigEntry)
         name=f"{DOMAIN}_flow",
         update_method=async_update_flow_data,
         update_interval=flow_update_interval,  # Configurable fast updates for flow
+        always_update=False,
     )
 
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
+    await settings_coordinator.async_config_entry_first_refresh()
     await flow_coordinator.async_config_entry_first_refresh()
 
     # Store data in runtime_data
-    entry.runtime_data = PentairWaterData(api, coordinator, flow_coordinator)
+    # Build the device info once for all entities, using the serial and
+    # software version from the first refresh
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.data[CONF_DEVICE_ID])},
+        name=entry.data[CONF_DEVICE_NAME] or DEFAULT_NAME,
+        manufacturer=MANUFACTURER,
+        model="Water Softener",
+        serial_number=coordinator.data.get("serial"),
+        sw_version=coordinator.data.get("software"),
+    )
+
+    entry.runtime_data = PentairWaterData(
+        api, coordinator, settings_coordinator, flow_coordinator, device_info
+    )
 
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
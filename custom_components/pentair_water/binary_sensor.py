@@ -1,24 +1,42 @@
 """Binary sensor platform for Pentair Water Softener."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
+import time
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
 from . import PentairWaterConfigEntry
-from .const import ATTR_WARNINGS, ATTR_LAST_MAINTENANCE
+from .const import (
+    ATTR_LAST_MAINTENANCE,
+    ATTR_LOW_SALT,
+    ATTR_NEXT_SERVICE_DATE,
+    ATTR_NEXT_SERVICE_EPOCH,
+)
 from .entity import PentairWaterEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Default service interval is 2 years (730 days)
-DEFAULT_SERVICE_INTERVAL_DAYS = 730
+# Entities only read coordinator data, so updates need no serialization
+PARALLEL_UPDATES = 0
+
+SECONDS_PER_DAY = 86400
+
+# The coordinator only notifies entities when data changes, so re-evaluate
+# the time-dependent service due state on a timer as well
+SERVICE_DUE_RECHECK_INTERVAL = timedelta(hours=1)
+
+
+def _days_until(epoch: float) -> int:
+    """Return whole days from now until the given timestamp (floored like timedelta.days)."""
+    return int((epoch - time.time()) // SECONDS_PER_DAY)
 
 
 async def async_setup_entry(
@@ -49,20 +67,7 @@ class PentairWaterLowSaltSensor(PentairWaterEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if low salt warning is active."""
-        if self.coordinator.data is None:
-            return False
-
-        warnings = self.coordinator.data.get(ATTR_WARNINGS, [])
-        if not warnings:
-            return False
-
-        # Check if any warning contains "Salt" in the description
-        for warning in warnings:
-            description = warning.get("description", "")
-            if "Salt" in description or "salt" in description.lower():
-                return True
-
-        return False
+        return bool(self.coordinator.data and self.coordinator.data.get(ATTR_LOW_SALT))
 
 
 class PentairWaterServiceDueSensor(PentairWaterEntity, BinarySensorEntity):
@@ -76,35 +81,32 @@ class PentairWaterServiceDueSensor(PentairWaterEntity, BinarySensorEntity):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_service_due"
 
+    async def async_added_to_hass(self) -> None:
+        """Schedule periodic re-evaluation of the service due state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_recheck_due, SERVICE_DUE_RECHECK_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_recheck_due(self, _now) -> None:
+        """Write state so days until service stays current without new data."""
+        self.async_write_ha_state()
+
     @property
     def is_on(self) -> bool:
         """Return true if service/maintenance is due."""
         if self.coordinator.data is None:
             return False
 
-        last_maintenance = self.coordinator.data.get(ATTR_LAST_MAINTENANCE)
-        if not last_maintenance:
+        next_service_epoch = self.coordinator.data.get(ATTR_NEXT_SERVICE_EPOCH)
+        if next_service_epoch is None:
             return False
 
-        try:
-            # Parse the maintenance date
-            if isinstance(last_maintenance, str):
-                maintenance_date = datetime.fromisoformat(
-                    last_maintenance.replace("Z", "+00:00")
-                )
-            else:
-                maintenance_date = last_maintenance
-
-            # Calculate next service date (1 year from last maintenance)
-            next_service = maintenance_date + timedelta(days=DEFAULT_SERVICE_INTERVAL_DAYS)
-
-            # Service is due if we're past the next service date or within 30 days
-            days_until_service = (next_service - datetime.now(maintenance_date.tzinfo)).days
-            return days_until_service <= 30
-
-        except (ValueError, TypeError) as err:
-            _LOGGER.debug("Error parsing maintenance date: %s", err)
-            return False
+        # Service is due if we're past the next service date or within 30 days
+        return _days_until(next_service_epoch) <= 30
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -112,26 +114,14 @@ class PentairWaterServiceDueSensor(PentairWaterEntity, BinarySensorEntity):
         if self.coordinator.data is None:
             return {}
 
-        last_maintenance = self.coordinator.data.get(ATTR_LAST_MAINTENANCE)
-        if not last_maintenance:
-            return {}
-
-        try:
-            if isinstance(last_maintenance, str):
-                maintenance_date = datetime.fromisoformat(
-                    last_maintenance.replace("Z", "+00:00")
-                )
-            else:
-                maintenance_date = last_maintenance
-
-            next_service = maintenance_date + timedelta(days=DEFAULT_SERVICE_INTERVAL_DAYS)
-            days_until = (next_service - datetime.now(maintenance_date.tzinfo)).days
-
-            return {
-                "last_maintenance": last_maintenance,
-                "next_service_date": next_service.isoformat(),
-                "days_until_service": days_until,
-            }
-        except (ValueError, TypeError):
+        next_service = self.coordinator.data.get(ATTR_NEXT_SERVICE_DATE)
+        if next_service is None:
             return {}
 
+        return {
+            "last_maintenance": self.coordinator.data[ATTR_LAST_MAINTENANCE].isoformat(),
+            "next_service_date": next_service.isoformat(),
+            "days_until_service": _days_until(
+                self.coordinator.data[ATTR_NEXT_SERVICE_EPOCH]
+            ),
+        }
@@ -6,10 +6,11 @@ from typing import Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import PentairWaterConfigEntry
-from .const import DOMAIN
+from .const import API_HEADERS, DOMAIN
 from .entity import PentairWaterEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,37 +43,28 @@ class PentairWaterForceRegenerationButton(PentairWaterEntity, ButtonEntity):
         super().__init__(coordinator, entry)
         self._api = api
         self._attr_unique_id = f"{self._device_id}_force_regeneration"
+        self._url = f"{api._base_url}/{api._api}/water_softeners/{self._device_id}/regeneration"
 
     async def async_press(self) -> None:
         """Handle the button press - trigger regeneration."""
         _LOGGER.info("Triggering manual regeneration for Pentair water softener")
         try:
-            await self.hass.async_add_executor_job(self._trigger_regeneration)
+            # Login and device selection are blocking calls in the library,
+            # only needed when a failed refresh has reset the client
+            if not self._api.is_logged_in or not self._api.is_device_selected:
+                await self.hass.async_add_executor_job(self._api._setup_if_needed)
+
+            headers = {**API_HEADERS, **self._api._auth_headers()}
+
+            session = async_get_clientsession(self.hass, verify_ssl=False)
+            async with session.post(self._url, headers=headers) as response:
+                text = await response.text()
+            _LOGGER.debug("Regeneration API response: %s - %s", response.status, text)
+
+            if response.status not in (200, 201, 204):
+                _LOGGER.warning("Regeneration request returned status %s", response.status)
+
             # Refresh data after triggering
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Error triggering regeneration: %s", err)
-
-    def _trigger_regeneration(self) -> None:
-        """Trigger regeneration via API."""
-        import requests
-
-        self._api._setup_if_needed()
-        device_id = self._api.device.id
-
-        # Try the regeneration endpoint
-        url = f"{self._api._base_url}/{self._api._api}/water_softeners/{device_id}/regeneration"
-        headers = {
-            'User-Agent': 'App/3.5.1 (iPhone; iOS 15.1.1; Scale/2.0.0)',
-            'app_version': '3.5.1',
-            'language': 'en',
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-        }
-        headers.update(self._api._auth_headers())
-
-        response = requests.post(url, headers=headers, verify=False)
-        _LOGGER.debug("Regeneration API response: %s - %s", response.status_code, response.text)
-
-        if response.status_code not in (200, 201, 204):
-            _LOGGER.warning("Regeneration request returned status %s", response.status_code)
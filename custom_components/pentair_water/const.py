@@ -1,6 +1,8 @@
 """Constants for Pentair Water Softener integration."""
+from collections.abc import Mapping
 from datetime import timedelta
-from typing import Final
+from types import MappingProxyType
+from typing import Any, Final
 
 DOMAIN: Final = "pentair_water"
 MANUFACTURER: Final = "Pentair"
@@ -9,8 +11,27 @@ DEFAULT_NAME: Final = "Pentair Water Softener"
 # Scan interval for polling
 DEFAULT_SCAN_INTERVAL: Final = 30  # seconds
 DEFAULT_FLOW_SCAN_INTERVAL: Final = 5  # seconds
+SETTINGS_SCAN_INTERVAL: Final = 3600  # seconds
 SCAN_INTERVAL: Final = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
 
+# Minimum seconds between refreshes requested by entity actions
+REQUEST_REFRESH_COOLDOWN: Final = 10
+
+# Default service interval is 2 years (730 days)
+DEFAULT_SERVICE_INTERVAL_DAYS: Final = 730
+
+# Headers sent with direct requests to the Erie Connect API
+API_HEADERS: Final = MappingProxyType({
+    "User-Agent": "App/3.5.1 (iPhone; iOS 15.1.1; Scale/2.0.0)",
+    "app_version": "3.5.1",
+    "language": "en",
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+})
+
+# Shared read-only fallback for missing nested data
+EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
 # Config entry keys
 CONF_EMAIL: Final = "email"
 CONF_PASSWORD: Final = "password"
@@ -38,3 +59,5 @@ ATTR_SETTINGS: Final = "settings"
 ATTR_HOLIDAY_MODE: Final = "holiday_mode"
 ATTR_WATER_HARDNESS: Final = "water_hardness"
 ATTR_FLOW: Final = "flow"
+ATTR_NEXT_SERVICE_DATE: Final = "next_service_date"
+ATTR_NEXT_SERVICE_EPOCH: Final = "next_service_epoch"
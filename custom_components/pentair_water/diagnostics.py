@@ -15,7 +15,7 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator = entry.runtime_data.coordinator
+    runtime_data = entry.runtime_data
 
     # Redact sensitive information
     config_data = {
@@ -25,5 +25,6 @@ async def async_get_config_entry_diagnostics(
 
     return {
         "config_entry": config_data,
-        "coordinator_data": coordinator.data,
+        "coordinator_data": runtime_data.coordinator.data,
+        "settings_coordinator_data": runtime_data.settings_coordinator.data,
     }
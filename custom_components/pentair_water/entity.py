@@ -1,21 +1,27 @@
 """Base entity for Pentair Water Softener."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from .const import CONF_DEVICE_ID, CONF_DEVICE_NAME, DOMAIN, MANUFACTURER
+from .const import CONF_DEVICE_ID, CONF_DEVICE_NAME
 
 if TYPE_CHECKING:
     from . import PentairWaterConfigEntry
 
 
 class PentairWaterEntity(CoordinatorEntity):
-    """Base class for Pentair Water Softener entities."""
+    """Base class for Pentair Water Softener entities.
+
+    The coordinators are created with always_update=False, so entities are
+    only updated when newly fetched data compares unequal to the previous
+    data. Coordinator data must therefore be plain, comparable values.
+    """
 
     _attr_has_entity_name = True
+    _last_data: dict[str, Any] | None = None
 
     def __init__(
         self,
@@ -27,19 +33,36 @@ class PentairWaterEntity(CoordinatorEntity):
         self._entry = entry
         self._device_id = entry.data[CONF_DEVICE_ID]
         self._device_name = entry.data[CONF_DEVICE_NAME]
+        # Shared by all entities of the entry, built once in async_setup_entry
+        self._attr_device_info = entry.runtime_data.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Populate state from the coordinator data available at setup."""
+        await super().async_added_to_hass()
+        self._refresh_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached state once per coordinator update, then write it."""
+        self._refresh_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _refresh_from_coordinator(self) -> None:
+        """Recompute cached state, unless the coordinator data is unchanged.
+
+        A failed refresh notifies listeners with the previous data object, so
+        only the availability changes and there is nothing to recompute.
+        """
+        data = self.coordinator.data
+        if data is None or data is self._last_data:
+            return
+        self._last_data = data
+        self._update_from_data(data)
+
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update cached entity attributes from coordinator data.
 
-        # Get serial and software from coordinator data if available
-        serial = None
-        sw_version = None
-        if coordinator.data:
-            serial = coordinator.data.get("serial")
-            sw_version = coordinator.data.get("software")
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name or "Pentair Water Softener",
-            manufacturer=MANUFACTURER,
-            model="Water Softener",
-            serial_number=serial,
-            sw_version=sw_version,
-        )
+        Entities that derive their state from coordinator data override this
+        and set their _attr_* values here, so state reads are plain attribute
+        lookups instead of re-parsing the data on every access.
+        """
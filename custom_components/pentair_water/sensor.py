@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from collections.abc import Callable, Mapping
 from datetime import datetime
 import logging
-from typing import Any
+from typing import Any, TypeVar
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -24,11 +25,36 @@ from .const import (
     ATTR_TOTAL_VOLUME,
     ATTR_WARNINGS,
     DOMAIN,
+    EMPTY_MAPPING,
 )
 from .entity import PentairWaterEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Entities only read coordinator data, so updates need no serialization
+PARALLEL_UPDATES = 0
+
+
+def _safe_cast(value: Any, caster: Callable[[Any], _T]) -> _T | None:
+    """Convert a value with caster, returning None if missing or invalid."""
+    if value is None:
+        return None
+    try:
+        return caster(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_liters(value: Any) -> int:
+    """Parse a volume like "1162 L" (or a plain integer) into liters."""
+    if isinstance(value, int):
+        return value
+    # Split on any whitespace, like the total volume parsing in __init__.py
+    parts = value.split(maxsplit=1)
+    return int(parts[0] if parts else value)
+
 
 @dataclass(frozen=True, kw_only=True)
 class PentairWaterSensorEntityDescription(SensorEntityDescription):
@@ -74,27 +100,26 @@ async def async_setup_entry(
 ) -> None:
     """Set up Pentair Water Softener sensors."""
     coordinator = entry.runtime_data.coordinator
+    settings_coordinator = entry.runtime_data.settings_coordinator
     flow_coordinator = entry.runtime_data.flow_coordinator
 
-    entities: list[SensorEntity] = []
-
-    # Add standard sensors
-    for description in SENSOR_DESCRIPTIONS:
-        entities.append(PentairWaterSensor(coordinator, entry, description))
-
-    # Add warnings sensor
-    entities.append(PentairWaterWarningsSensor(coordinator, entry))
-
-    # Add status sensors
-    entities.append(PentairWaterStatusSensor(coordinator, entry))
-    entities.append(PentairWaterCapacityRemainingSensor(coordinator, entry))
-    entities.append(PentairWaterDaysRemainingSensor(coordinator, entry))
-
-    # Add water hardness sensor
-    entities.append(PentairWaterHardnessSensor(coordinator, entry))
-
-    # Add current flow rate sensor (uses fast-polling flow coordinator)
-    entities.append(PentairWaterCurrentFlowSensor(flow_coordinator, entry))
+    entities: list[SensorEntity] = [
+        # Standard sensors
+        *(
+            PentairWaterSensor(coordinator, entry, description)
+            for description in SENSOR_DESCRIPTIONS
+        ),
+        # Warnings sensor
+        PentairWaterWarningsSensor(coordinator, entry),
+        # Status sensors
+        PentairWaterStatusSensor(coordinator, entry),
+        PentairWaterCapacityRemainingSensor(coordinator, entry),
+        PentairWaterDaysRemainingSensor(coordinator, entry),
+        # Water hardness sensor (uses slow-polling settings coordinator)
+        PentairWaterHardnessSensor(settings_coordinator, entry),
+        # Current flow rate sensor (uses fast-polling flow coordinator)
+        PentairWaterCurrentFlowSensor(flow_coordinator, entry),
+    ]
 
     async_add_entities(entities)
 
@@ -115,32 +140,24 @@ class PentairWaterSensor(PentairWaterEntity, SensorEntity):
         self.entity_description = description
         self._attr_unique_id = f"{self._device_id}_{description.key}"
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-
-        value = self.coordinator.data.get(self.entity_description.value_fn)
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the state of the sensor."""
+        value = data.get(self.entity_description.value_fn)
 
-        # Handle timestamp conversion
+        # Timestamps are already parsed by the coordinator
         if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
-            if value:
-                try:
-                    return datetime.fromisoformat(value.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    _LOGGER.warning("Failed to parse timestamp value: %s", value)
-                    return None
-            return None
+            self._attr_native_value = value if isinstance(value, datetime) else None
+            return
 
         # Handle numeric values
         if self.entity_description.state_class is not None:
             try:
-                return int(value) if value is not None else None
+                self._attr_native_value = int(value) if value is not None else None
             except (ValueError, TypeError):
-                return value
+                self._attr_native_value = value
+            return
 
-        return value
+        self._attr_native_value = value
 
 
 class PentairWaterWarningsSensor(PentairWaterEntity, SensorEntity):
@@ -153,23 +170,13 @@ class PentairWaterWarningsSensor(PentairWaterEntity, SensorEntity):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_warnings"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-
-        warnings = self.coordinator.data.get(ATTR_WARNINGS, [])
-        if not warnings:
-            return None
-
-        warning_text = ""
-        for warning in warnings:
-            description = warning.get("description", "")
-            if description:
-                warning_text += f"⚠️ {description}\n"
-
-        return warning_text.strip() if warning_text else None
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the state of the sensor."""
+        self._attr_native_value = "\n".join(
+            f"⚠️ {description}"
+            for warning in data.get(ATTR_WARNINGS) or []
+            if (description := warning.get("description"))
+        ) or None
 
 
 class PentairWaterStatusSensor(PentairWaterEntity, SensorEntity):
@@ -181,24 +188,18 @@ class PentairWaterStatusSensor(PentairWaterEntity, SensorEntity):
         """Initialize the status sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_status"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the status."""
-        if self.coordinator.data is None:
-            return None
-
-        status = self.coordinator.data.get("status", {})
-        return status.get("title")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional status attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        status = self.coordinator.data.get("status", {})
-        return {
+        self._last_status: Mapping[str, Any] | None = None
+
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the status and its additional attributes."""
+        status = data.get("status") or EMPTY_MAPPING
+        # Other dashboard fields change more often than the status itself
+        if status == self._last_status:
+            return
+        self._last_status = status
+
+        self._attr_native_value = status.get("title")
+        self._attr_extra_state_attributes = {
             "status_code": status.get("code"),
             "percentage": status.get("percentage"),
         }
@@ -217,32 +218,29 @@ class PentairWaterCapacityRemainingSensor(PentairWaterEntity, SensorEntity):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_capacity_remaining"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the remaining capacity."""
-        if self.coordinator.data is None:
-            return None
-
-        status = self.coordinator.data.get("status", {})
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the remaining capacity."""
+        status = data.get("status") or EMPTY_MAPPING
         _LOGGER.debug("Capacity remaining - status data: %s", status)
-        
+
         # Try to get capacity from extra field (format: "1162 L")
         extra = status.get("extra", "")
         if extra:
             try:
                 # Parse "1162 L" format
-                value = int(extra.split()[0])
+                value = _parse_liters(extra)
                 _LOGGER.debug("Capacity remaining from extra: %s", value)
-                return value
-            except (ValueError, IndexError) as err:
+                self._attr_native_value = value
+                return
+            except (ValueError, AttributeError) as err:
                 _LOGGER.debug("Failed to parse extra '%s': %s", extra, err)
-        
+
         # Try percentage-based calculation if we have max capacity info
         percentage = status.get("percentage")
         if percentage is not None:
             _LOGGER.debug("Capacity remaining - percentage: %s", percentage)
-        
-        return None
+
+        self._attr_native_value = None
 
 
 class PentairWaterDaysRemainingSensor(PentairWaterEntity, SensorEntity):
@@ -257,14 +255,9 @@ class PentairWaterDaysRemainingSensor(PentairWaterEntity, SensorEntity):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_days_remaining"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the days until regeneration."""
-        if self.coordinator.data is None:
-            return None
-
-        status = self.coordinator.data.get("status", {})
-        return status.get("days_remaining")
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the days until regeneration."""
+        self._attr_native_value = (data.get("status") or EMPTY_MAPPING).get("days_remaining")
 
 
 class PentairWaterHardnessSensor(PentairWaterEntity, SensorEntity):
@@ -279,20 +272,10 @@ class PentairWaterHardnessSensor(PentairWaterEntity, SensorEntity):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_water_hardness"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the water hardness in French degrees."""
-        if self.coordinator.data is None:
-            return None
-
-        hardness = self.coordinator.data.get("water_hardness")
-        if hardness is not None:
-            try:
-                # API returns French degrees (°fH) directly
-                return float(hardness)
-            except (ValueError, TypeError):
-                return None
-        return None
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the water hardness in French degrees."""
+        # API returns French degrees (°fH) directly
+        self._attr_native_value = _safe_cast(data.get("water_hardness"), float)
 
 
 class PentairWaterCurrentFlowSensor(PentairWaterEntity, SensorEntity):
@@ -307,19 +290,9 @@ class PentairWaterCurrentFlowSensor(PentairWaterEntity, SensorEntity):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_current_flow"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current flow rate."""
-        if self.coordinator.data is None:
-            return None
-
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the current flow rate."""
         # Flow is directly available as a number from the API
-        flow = self.coordinator.data.get("flow")
-        if flow is not None:
-            try:
-                return float(flow)
-            except (ValueError, TypeError):
-                return None
-        return None
+        self._attr_native_value = _safe_cast(data.get("flow"), float)
 
 
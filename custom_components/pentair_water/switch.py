@@ -4,14 +4,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import requests
-
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import PentairWaterConfigEntry
-from .const import DOMAIN
+from .const import API_HEADERS, DOMAIN
 from .entity import PentairWaterEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,6 +43,7 @@ class PentairWaterHolidayModeSwitch(PentairWaterEntity, SwitchEntity):
         super().__init__(coordinator, entry)
         self._api = api
         self._attr_unique_id = f"{self._device_id}_holiday_mode"
+        self._url = f"{api._base_url}/{api._api}/water_softeners/{self._device_id}/holiday"
 
     @property
     def is_on(self) -> bool | None:
@@ -56,7 +56,7 @@ class PentairWaterHolidayModeSwitch(PentairWaterEntity, SwitchEntity):
         """Turn on holiday mode."""
         _LOGGER.debug("Turning on holiday mode")
         try:
-            await self.hass.async_add_executor_job(self._set_holiday_mode, True)
+            await self._async_set_holiday_mode(True)
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Error turning on holiday mode: %s", err)
@@ -65,32 +65,27 @@ class PentairWaterHolidayModeSwitch(PentairWaterEntity, SwitchEntity):
         """Turn off holiday mode."""
         _LOGGER.debug("Turning off holiday mode")
         try:
-            await self.hass.async_add_executor_job(self._set_holiday_mode, False)
+            await self._async_set_holiday_mode(False)
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Error turning off holiday mode: %s", err)
 
-    def _set_holiday_mode(self, state: bool) -> None:
+    async def _async_set_holiday_mode(self, state: bool) -> None:
         """Set holiday mode via API."""
-        self._api._setup_if_needed()
-        device_id = self._api.device.id
-
-        # Use the holiday endpoint
-        url = f"{self._api._base_url}/{self._api._api}/water_softeners/{device_id}/holiday"
-        headers = {
-            'User-Agent': 'App/3.5.1 (iPhone; iOS 15.1.1; Scale/2.0.0)',
-            'app_version': '3.5.1',
-            'language': 'en',
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-        }
-        headers.update(self._api._auth_headers())
+        # Login and device selection are blocking calls in the library,
+        # only needed when a failed refresh has reset the client
+        if not self._api.is_logged_in or not self._api.is_device_selected:
+            await self.hass.async_add_executor_job(self._api._setup_if_needed)
+
+        headers = {**API_HEADERS, **self._api._auth_headers()}
 
         # Toggle holiday mode
         data = {"holiday_mode": state}
 
-        response = requests.post(url, json=data, headers=headers, verify=False)
-        _LOGGER.debug("Holiday mode API response: %s - %s", response.status_code, response.text)
+        session = async_get_clientsession(self.hass, verify_ssl=False)
+        async with session.post(self._url, json=data, headers=headers) as response:
+            text = await response.text()
+        _LOGGER.debug("Holiday mode API response: %s - %s", response.status, text)
 
-        if response.status_code not in (200, 201, 204):
-            _LOGGER.warning("Holiday mode request returned status %s", response.status_code)
+        if response.status not in (200, 201, 204):
+            _LOGGER.warning("Holiday mode request returned status %s", response.status)
@@ -6,43 +6,91 @@ This script tests the Erie Connect API connection without needing Home Assistant
 Run with: python3 test_connection.py
 
 You'll be prompted for your Erie Connect email and password.
+With --cache-auth, the login token is cached in ~/.cache/pentair_test/auth.json
+until it expires, and later runs with the flag skip the login. Leave the flag off
+when checking credentials: a cached token is used without checking the password.
 """
 
+import argparse
 import getpass
 import json
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SEP = "=" * 70
+
+# Tokens from earlier runs, so repeated runs can skip the login round trip
+AUTH_CACHE = Path.home() / ".cache" / "pentair_test" / "auth.json"
+
+# (section title, client method, optional)
+ENDPOINTS = (
+    ("INFO ENDPOINT (api.info())", "info", False),
+    ("DASHBOARD ENDPOINT (api.dashboard())", "dashboard", False),
+    ("SETTINGS ENDPOINT (api.settings())", "settings", False),
+    ("FLOW ENDPOINT (api.flow())", "flow", False),
+    ("FEATURES ENDPOINT (api.features())", "features", True),
+    ("STATISTICS ENDPOINT (api.statistics() - if available)", "statistics", True),
+    ("STATUS ENDPOINT (api.status() - if available)", "status", True),
+)
+
+
+def load_client():
+    """Import the Erie Connect client, exiting with a hint if it is missing."""
+    try:
+        from erie_connect.client import ErieConnect
+    except ImportError:
+        print("❌ erie-connect package not installed.")
+        print("   Install it with: pip install erie-connect")
+        sys.exit(1)
+    return ErieConnect
+
+
+def load_cached_auth(auth_cls, email):
+    """Return the cached auth for this email if it is still valid."""
+    try:
+        cached = json.loads(AUTH_CACHE.read_text())
+        if cached["email"] != email or int(cached["expiry"]) <= time.time() + 60:
+            return None
+        return auth_cls(
+            access_token=cached["access_token"],
+            client=cached["client"],
+            uid=cached["uid"],
+            expiry=cached["expiry"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
-try:
-    from erie_connect.client import ErieConnect
-except ImportError:
-    print("❌ erie-connect package not installed.")
-    print("   Install it with: pip install erie-connect")
-    sys.exit(1)
-
-
-def pretty_print_dict(d, indent=3):
-    """Pretty print a dictionary."""
-    for key, value in d.items():
-        if isinstance(value, dict):
-            print(" " * indent + f"{key}:")
-            pretty_print_dict(value, indent + 3)
-        elif isinstance(value, list):
-            print(" " * indent + f"{key}: [")
-            for item in value:
-                if isinstance(item, dict):
-                    pretty_print_dict(item, indent + 6)
-                else:
-                    print(" " * (indent + 6) + str(item))
-            print(" " * indent + "]")
-        else:
-            print(" " * indent + f"{key}: {value}")
 
+def login(api, email, cache_auth):
+    """Log in, optionally caching the new auth token readable only by the user."""
+    print("🔄 Logging in...")
+    api.login()
+    print("✅ Login successful!")
+    if not cache_auth:
+        return
+    AUTH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(AUTH_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({
+            "email": email,
+            "access_token": api.auth.access_token,
+            "client": api.auth.client,
+            "uid": api.auth.uid,
+            "expiry": api.auth.expiry,
+        }, f)
+    os.chmod(AUTH_CACHE, 0o600)
 
-def test_connection():
+
+def test_connection(cache_auth=False):
     """Test connection to Erie Connect API."""
-    print("=" * 70)
+    ErieConnect = load_client()
+    
+    print(SEP)
     print("Pentair Water Softener - Full API Data Dump")
-    print("=" * 70)
+    print(SEP)
     print()
     
     # Get credentials
@@ -53,13 +101,15 @@ def test_connection():
     print("🔄 Connecting to Erie Connect API...")
     
     try:
-        # Create API client
-        api = ErieConnect(email, password)
+        # Create API client, reusing a cached token when there is one
+        cached_auth = load_cached_auth(ErieConnect.Auth, email) if cache_auth else None
+        api = ErieConnect(email, password, auth=cached_auth)
         
         # Login
-        print("🔄 Logging in...")
-        api.login()
-        print("✅ Login successful!")
+        if cached_auth is None:
+            login(api, email, cache_auth)
+        else:
+            print("✅ Using cached login (skip with: rm " + str(AUTH_CACHE) + ")")
         
         # Get auth info
         print()
@@ -72,7 +122,17 @@ def test_connection():
         # Select device
         print()
         print("🔄 Selecting first active device...")
-        api.select_first_active_device()
+        try:
+            api.select_first_active_device()
+        except Exception:
+            # The client drops its auth on a 401; if the cached token was
+            # rejected, log in again once
+            if cached_auth is None or api.auth is not None:
+                raise
+            print("⚠️  Cached login rejected")
+            AUTH_CACHE.unlink(missing_ok=True)
+            login(api, email, cache_auth)
+            api.select_first_active_device()
         
         if api.device is None:
             print("❌ No device found!")
@@ -84,82 +144,34 @@ def test_connection():
         print(f"   Device ID: {api.device.id}")
         print(f"   Device Name: {api.device.name}")
         
-        # ===== INFO ENDPOINT =====
-        print()
-        print("=" * 70)
-        print("📊 INFO ENDPOINT (api.info())")
-        print("=" * 70)
-        info = api.info()
-        print("RAW DATA:")
-        pretty_print_dict(info.content)
+        # The endpoints are independent, so fetch them all at once and
+        # print the results in order
+        with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as executor:
+            futures = [
+                executor.submit(lambda name=name: getattr(api, name)())
+                for _, name, _ in ENDPOINTS
+            ]
         
-        # ===== DASHBOARD ENDPOINT =====
-        print()
-        print("=" * 70)
-        print("📊 DASHBOARD ENDPOINT (api.dashboard())")
-        print("=" * 70)
-        dashboard = api.dashboard()
-        print("RAW DATA:")
-        pretty_print_dict(dashboard.content)
-        
-        # ===== SETTINGS ENDPOINT =====
-        print()
-        print("=" * 70)
-        print("📊 SETTINGS ENDPOINT (api.settings())")
-        print("=" * 70)
-        settings = api.settings()
-        print("RAW DATA:")
-        pretty_print_dict(settings.content)
-        
-        # ===== FLOW ENDPOINT =====
-        print()
-        print("=" * 70)
-        print("📊 FLOW ENDPOINT (api.flow())")
-        print("=" * 70)
-        flow = api.flow()
-        print("RAW DATA:")
-        pretty_print_dict(flow.content)
-        
-        # ===== FEATURES ENDPOINT =====
-        print()
-        print("=" * 70)
-        print("📊 FEATURES ENDPOINT (api.features())")
-        print("=" * 70)
-        try:
-            features = api.features()
-            print("RAW DATA:")
-            pretty_print_dict(features.content)
-        except Exception as e:
-            print(f"   Not available or error: {e}")
-        
-        # ===== STATISTICS ENDPOINT (if available) =====
-        print()
-        print("=" * 70)
-        print("📊 STATISTICS ENDPOINT (api.statistics() - if available)")
-        print("=" * 70)
-        try:
-            statistics = api.statistics()
-            print("RAW DATA:")
-            pretty_print_dict(statistics.content)
-        except Exception as e:
-            print(f"   Not available or error: {e}")
-        
-        # ===== STATUS ENDPOINT (if available) =====
-        print()
-        print("=" * 70)
-        print("📊 STATUS ENDPOINT (api.status() - if available)")
-        print("=" * 70)
-        try:
-            status = api.status()
+        for (title, _, optional), future in zip(ENDPOINTS, futures):
+            print(f"\n{SEP}\n📊 {title}\n{SEP}")
+            try:
+                # The client can return None instead of raising, so reading
+                # .content has to be covered as well
+                dump = json.dumps(
+                    future.result().content, indent=2, ensure_ascii=False, default=str
+                )
+            except Exception as e:
+                if not optional:
+                    raise
+                print(f"   Not available or error: {e}")
+                continue
             print("RAW DATA:")
-            pretty_print_dict(status.content)
-        except Exception as e:
-            print(f"   Not available or error: {e}")
+            print(dump)
         
         print()
-        print("=" * 70)
+        print(SEP)
         print("✅ All API data retrieved successfully!")
-        print("=" * 70)
+        print(SEP)
         print()
         
         return True
@@ -179,5 +191,11 @@ def test_connection():
 
 
 if __name__ == "__main__":
-    success = test_connection()
+    parser = argparse.ArgumentParser(description="Dump all Erie Connect API data.")
+    parser.add_argument(
+        "--cache-auth",
+        action="store_true",
+        help="reuse and store the login token in " + str(AUTH_CACHE),
+    )
+    success = test_connection(cache_auth=parser.parse_args().cache_auth)
     sys.exit(0 if success else 1)
@@ -10,6 +10,10 @@ Run with: python3 -m pytest test_null_responses.py -v
 
 import pytest
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import threading
+import time
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock, patch, AsyncMock, PropertyMock
 from requests import RequestException
@@ -27,6 +31,53 @@ def _safe_get_content(response) -> dict:
     return getattr(response, "content", None) or {}
 
 
+def _has_salt_warning(descriptions):
+    """Check warnings for salt - mirrors the logic in __init__.py."""
+    return any("salt" in description.lower() for description in descriptions)
+
+
+def _parse_warnings(dashboard):
+    """Filter warnings and their descriptions - mirrors the logic in __init__.py."""
+    warnings = [
+        warning for warning in dashboard.get("warnings") or [] if isinstance(warning, dict)
+    ]
+    descriptions = tuple(
+        description
+        for warning in warnings
+        if isinstance(description := warning.get("description"), str)
+    )
+    return warnings, descriptions
+
+
+def _parse_liters(value):
+    """Parse a volume - mirrors the logic in sensor.py."""
+    if isinstance(value, int):
+        return value
+    parts = value.split(maxsplit=1)
+    return int(parts[0] if parts else value)
+
+
+def _parse_timestamp(value):
+    """Parse an API timestamp - mirrors the logic in __init__.py."""
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_timestamp_str(value)
+
+
+@lru_cache(maxsize=4)
+def _parse_timestamp_str(value):
+    """Parse a timestamp string - mirrors the logic in __init__.py."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _days_until(epoch):
+    """Whole days until a timestamp - mirrors the logic in binary_sensor.py."""
+    return int((epoch - time.time()) // 86400)
+
+
 class TestNullResponseGuards:
     """Test that our getattr guards handle all None scenarios."""
 
@@ -118,6 +169,92 @@ class TestDataParsing:
         assert dashboard.get("holiday_mode", False) is False
         assert dashboard.get("meta", {}).get("regen_time") is None
 
+    def test_low_salt_detected_case_insensitive(self):
+        """A warning mentioning salt in any case should flag low salt."""
+        dashboard = {"warnings": [{"description": "Refill Salt"}, {"description": "other"}]}
+        _, descriptions = _parse_warnings(dashboard)
+        assert _has_salt_warning(descriptions) is True
+
+    def test_low_salt_missing_description(self):
+        """Warnings without (or with None) description should not flag low salt."""
+        dashboard = {"warnings": [{}, {"description": None}]}
+        _, descriptions = _parse_warnings(dashboard)
+        assert descriptions == ()
+        assert _has_salt_warning(descriptions) is False
+
+    def test_warnings_null(self):
+        """A null warnings list should give no warnings, not fail the refresh."""
+        warnings, descriptions = _parse_warnings({"warnings": None})
+        assert warnings == []
+        assert _has_salt_warning(descriptions) is False
+
+    def test_warnings_malformed_entries(self):
+        """Non-dict entries and non-string descriptions should be skipped."""
+        dashboard = {
+            "warnings": ["low_salt", None, {"description": 42}, {"description": "Salt low"}]
+        }
+        warnings, descriptions = _parse_warnings(dashboard)
+        assert warnings == [{"description": 42}, {"description": "Salt low"}]
+        assert descriptions == ("Salt low",)
+        assert _has_salt_warning(descriptions) is True
+
+
+class TestParseLiters:
+    """Test parsing of capacity values like "1162 L"."""
+
+    def test_string_with_unit(self):
+        assert _parse_liters("1162 L") == 1162
+
+    def test_plain_int(self):
+        assert _parse_liters(1162) == 1162
+
+    def test_surrounding_and_other_whitespace(self):
+        assert _parse_liters(" 1162 L") == 1162
+        assert _parse_liters("1162\tL") == 1162
+        assert _parse_liters("1162\u00a0L") == 1162
+
+    def test_empty_string_raises(self):
+        with pytest.raises(ValueError):
+            _parse_liters("")
+
+    def test_invalid_string_raises(self):
+        with pytest.raises(ValueError):
+            _parse_liters("L")
+
+
+class TestMaintenanceParsing:
+    """Test the timestamp parsing and next service calculation done once per refresh."""
+
+    def test_missing_timestamp(self):
+        assert _parse_timestamp(None) is None
+        assert _parse_timestamp("") is None
+
+    def test_invalid_timestamp(self):
+        assert _parse_timestamp("not a date") is None
+
+    def test_non_string_timestamp(self):
+        assert _parse_timestamp(12345) is None
+
+    def test_unhashable_timestamp(self):
+        """Dicts or lists must not reach the cache and fail the refresh."""
+        assert _parse_timestamp({"date": "2024-01-01"}) is None
+        assert _parse_timestamp(["2024-01-01"]) is None
+
+    def test_utc_maintenance_date(self):
+        last_maintenance = _parse_timestamp("2026-01-15T00:00:00Z")
+        next_service = last_maintenance + timedelta(days=730)
+        assert next_service.isoformat() == "2028-01-15T00:00:00+00:00"
+
+    def test_days_until_matches_timedelta_days(self):
+        """Epoch-based day count should agree with datetime subtraction."""
+        next_service = datetime.now(timezone.utc) + timedelta(days=12, hours=5)
+        expected = (next_service - datetime.now(timezone.utc)).days
+        assert _days_until(next_service.timestamp()) == expected
+
+        overdue = datetime.now(timezone.utc) - timedelta(days=3, hours=1)
+        expected = (overdue - datetime.now(timezone.utc)).days
+        assert _days_until(overdue.timestamp()) == expected
+
 
 class TestErieConnectLibraryBug:
     """
@@ -197,15 +334,12 @@ class TestErieConnectLibraryBug:
         response = None
         response_dashboard = None
         response_settings = None
-        response_flow = None
 
         info = getattr(response, "content", None) or {}
         dashboard_data = getattr(response_dashboard, "content", None) or {}
         settings = getattr(response_settings, "content", None) or {}
-        flow_data = getattr(response_flow, "content", None) or {}
         features = {}
 
-        settings_inner = settings.get("settings", {})
         dashboard = dashboard_data
         status_data = dashboard.get("status", {})
 
@@ -216,21 +350,22 @@ class TestErieConnectLibraryBug:
             total_volume = str(total_volume_raw)
 
         result = {
-            "last_regeneration": info.get("last_regeneration"),
+            "last_regeneration": _parse_timestamp(info.get("last_regeneration")),
             "nr_regenerations": info.get("nr_regenerations"),
-            "last_maintenance": info.get("last_maintenance"),
+            "last_maintenance": _parse_timestamp(info.get("last_maintenance")),
             "total_volume": total_volume,
-            "warnings": dashboard.get("warnings", []),
+            "warnings": _parse_warnings(dashboard)[0],
             "serial": info.get("serial"),
             "software": info.get("software", "").strip(),
             "status": status_data,
-            "settings": settings,
             "holiday_mode": dashboard.get("holiday_mode", False),
-            "features": features,
-            "flow": flow_data.get("flow", 0),
-            "water_hardness": settings_inner.get("install_hardness"),
             "regen_time": dashboard.get("meta", {}).get("regen_time"),
         }
+        settings_result = {
+            "settings": settings,
+            "features": features,
+            "water_hardness": settings.get("settings", {}).get("install_hardness"),
+        }
 
         # Verify we get a valid dict with safe defaults
         assert isinstance(result, dict)
@@ -239,11 +374,11 @@ class TestErieConnectLibraryBug:
         assert result["serial"] is None
         assert result["software"] == ""
         assert result["status"] == {}
-        assert result["settings"] == {}
+        assert settings_result["settings"] == {}
         assert result["holiday_mode"] is False
-        assert result["features"] == {}
-        assert result["flow"] == 0
-        assert result["water_hardness"] is None
+        assert settings_result["features"] == {}
+        assert "flow" not in result
+        assert settings_result["water_hardness"] is None
         assert result["regen_time"] is None
 
     def test_full_update_flow_valid_responses(self):
@@ -259,7 +394,7 @@ class TestErieConnectLibraryBug:
             "software": " v1.2.3 ",
         })
         response_dashboard = MockResponse(headers={}, content={
-            "warnings": ["low_salt"],
+            "warnings": [{"description": "Low salt"}],
             "status": {"capacity_remaining": 75},
             "holiday_mode": True,
             "meta": {"regen_time": "02:00"},
@@ -267,17 +402,12 @@ class TestErieConnectLibraryBug:
         response_settings = MockResponse(headers={}, content={
             "settings": {"install_hardness": 30},
         })
-        response_flow = MockResponse(headers={}, content={
-            "flow": 12.5,
-        })
 
         info = getattr(response, "content", None) or {}
         dashboard_data = getattr(response_dashboard, "content", None) or {}
         settings = getattr(response_settings, "content", None) or {}
-        flow_data = getattr(response_flow, "content", None) or {}
         features = {"feature1": True}
 
-        settings_inner = settings.get("settings", {})
         dashboard = dashboard_data
         status_data = dashboard.get("status", {})
 
@@ -288,33 +418,34 @@ class TestErieConnectLibraryBug:
             total_volume = str(total_volume_raw)
 
         result = {
-            "last_regeneration": info.get("last_regeneration"),
+            "last_regeneration": _parse_timestamp(info.get("last_regeneration")),
             "nr_regenerations": info.get("nr_regenerations"),
-            "last_maintenance": info.get("last_maintenance"),
+            "last_maintenance": _parse_timestamp(info.get("last_maintenance")),
             "total_volume": total_volume,
-            "warnings": dashboard.get("warnings", []),
+            "warnings": _parse_warnings(dashboard)[0],
             "serial": info.get("serial"),
             "software": info.get("software", "").strip(),
             "status": status_data,
-            "settings": settings,
             "holiday_mode": dashboard.get("holiday_mode", False),
-            "features": features,
-            "flow": flow_data.get("flow", 0),
-            "water_hardness": settings_inner.get("install_hardness"),
             "regen_time": dashboard.get("meta", {}).get("regen_time"),
         }
+        settings_result = {
+            "settings": settings,
+            "features": features,
+            "water_hardness": settings.get("settings", {}).get("install_hardness"),
+        }
 
-        assert result["last_regeneration"] == "2026-03-10"
+        assert result["last_regeneration"].isoformat() == "2026-03-10T00:00:00"
+        assert result["last_maintenance"].isoformat() == "2026-01-15T00:00:00"
         assert result["nr_regenerations"] == 42
         assert result["total_volume"] == "98765"
-        assert result["warnings"] == ["low_salt"]
+        assert result["warnings"] == [{"description": "Low salt"}]
         assert result["serial"] == "SN12345"
         assert result["software"] == "v1.2.3"
         assert result["status"] == {"capacity_remaining": 75}
         assert result["holiday_mode"] is True
-        assert result["features"] == {"feature1": True}
-        assert result["flow"] == 12.5
-        assert result["water_hardness"] == 30
+        assert settings_result["features"] == {"feature1": True}
+        assert settings_result["water_hardness"] == 30
         assert result["regen_time"] == "02:00"
 
 
@@ -348,7 +479,10 @@ class TestSafeApiCall:
         import logging
         _LOGGER = logging.getLogger(__name__)
 
+        auth_lock = threading.Lock()
+
         def _safe_api_call(api_method):
+            auth = api_mock.auth
             try:
                 result = api_method()
                 if result is None:
@@ -357,10 +491,10 @@ class TestSafeApiCall:
             except (AttributeError, RequestException):
                 _LOGGER.debug("API call %s failed, forcing re-login", getattr(api_method, '__name__', str(api_method)))
                 try:
-                    api_mock._auth = None
-                    api_mock._device = None
-                    api_mock.login()
-                    api_mock.select_first_active_device()
+                    with auth_lock:
+                        if api_mock.auth is auth or api_mock.auth is None:
+                            api_mock.login()
+                            api_mock.select_first_active_device()
                     return api_method()
                 except Exception:
                     return None
@@ -415,6 +549,24 @@ class TestSafeApiCall:
         assert result == expected
         api.login.assert_called_once()
 
+    def test_retry_skips_login_refreshed_by_other_thread(self):
+        """If another call already logged in again, just retry with its auth."""
+        api = MagicMock()
+        safe_call = self._make_safe_api_call(api)
+        expected = MockResponse(headers={}, content={"key": "value"})
+
+        def settings_racing_relogin():
+            if api.settings.call_count == 1:
+                api.auth = MagicMock()  # Replaced by a concurrent re-login
+                raise AttributeError("'NoneType' object has no attribute 'id'")
+            return expected
+
+        api.settings.side_effect = settings_racing_relogin
+
+        result = safe_call(api.settings)
+        assert result == expected
+        api.login.assert_not_called()
+
     def test_retry_also_fails_returns_none(self):
         """Both attempts fail — should return None, not crash."""
         api = MagicMock()